@@ -1,14 +1,30 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 """AppSync Requests Gql Client"""
-from typing import Optional
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse
 
+import requests
 from gql.client import Client
 from gql.transport.appsync_auth import AppSyncIAMAuthentication
+from gql.transport.exceptions import TransportAlreadyConnected
 from gql.transport.requests import RequestsHTTPTransport
+from requests.adapters import HTTPAdapter, Retry
 from requests.auth import AuthBase
 
+# sessions are shared by all transports to the same host so that pooled
+# connections survive client instances and warm Lambda invocations. They are
+# intentionally never closed; their sockets live as long as the container
+_SESSIONS: Dict[Tuple[str, int], requests.Session] = {}
+
+
+@lru_cache(maxsize=None)
+def get_iam_auth(host: str) -> AppSyncIAMAuthentication:
+    """Gets the AppSync IAM Authentication for a host, resolving credentials once"""
+    return AppSyncIAMAuthentication(host=host)
+
 
 class RequestsIamAuth(AuthBase):
     """Requests Sigv4 IAM Auth"""
@@ -17,13 +33,55 @@ class RequestsIamAuth(AuthBase):
 
     def __init__(self, url: str):
         self._host = str(urlparse(url).netloc)
-        self._auth = AppSyncIAMAuthentication(host=self._host)
+        self._auth = get_iam_auth(self._host)
 
     def __call__(self, r):
-        r.headers = self._auth.get_headers(data=r.body.decode("utf-8"))
+        # botocore signs the raw bytes body as-is, so there is no need to decode it
+        r.headers = self._auth.get_headers(data=r.body)
         return r
 
 
+class PooledRequestsHTTPTransport(RequestsHTTPTransport):
+    """Requests HTTP Transport using a connection pooled session per host
+
+    The session is shared by every transport to the same host, so it is set up
+    to not store cookies. Otherwise cookies set for one client would be sent by
+    all the others (AppSync IAM auth does not use cookies).
+    """
+
+    def connect(self):
+        if self.session is not None:
+            raise TransportAlreadyConnected("Transport is already connected")
+
+        key = (str(urlparse(self.url).netloc), self.retries)
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = requests.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            # copy of the retry policy in RequestsHTTPTransport.connect() from gql 3.2.0,
+            # re-check it when upgrading gql
+            max_retries = (
+                Retry(
+                    total=self.retries,
+                    backoff_factor=0.1,
+                    status_forcelist=[500, 502, 503, 504],
+                    allowed_methods=None,
+                )
+                if self.retries > 0
+                else 0
+            )
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=max_retries)
+            for prefix in "http://", "https://":
+                session.mount(prefix, adapter)
+            _SESSIONS[key] = session
+
+        self.session = session
+
+    def close(self):
+        # leave the shared session open so its connections can be reused
+        self.session = None
+
+
 class AppsyncRequestsGqlClient(Client):
     """AppSync Requests Gql Client"""
 
@@ -35,6 +93,8 @@ class AppsyncRequestsGqlClient(Client):
         **kwargs,
     ):
         auth = RequestsIamAuth(url=url)
-        transport = RequestsHTTPTransport(url=url, auth=auth, retries=retries, timeout=timeout)
+        transport = PooledRequestsHTTPTransport(
+            url=url, auth=auth, retries=retries, timeout=timeout
+        )
 
         super().__init__(transport=transport, **kwargs)
@@ -8,7 +8,13 @@ import json
 SUCCESS = "SUCCESS"
 FAILED = "FAILED"
 
-http = urllib3.PoolManager()
+http = urllib3.PoolManager(
+    maxsize=4,
+    block=False,
+    timeout=urllib3.Timeout(connect=3.0, read=10.0),
+    retries=urllib3.Retry(total=2, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504],
+                          allowed_methods=frozenset(['PUT']), raise_on_status=False)
+)
 
 
 def send(event, context, responseStatus, responseData, physicalResourceId=None, noEcho=False, reason=None):
@@ -27,18 +33,23 @@ def send(event, context, responseStatus, responseData, physicalResourceId=None,
         'Data' : responseData
     }
 
-    json_responseBody = json.dumps(responseBody)
+    json_responseBody = json.dumps(responseBody, separators=(',', ':'))
 
     print("Response body:")
-    print(json_responseBody)
+    if noEcho:
+        print("<redacted, {} bytes>".format(len(json_responseBody)))
+    else:
+        print(json_responseBody)
+
+    body = json_responseBody.encode('utf-8')
 
     headers = {
         'content-type' : '',
-        'content-length' : str(len(json_responseBody))
+        'content-length' : str(len(body))
     }
 
     try:
-        response = http.request('PUT', responseUrl, headers=headers, body=json_responseBody)
+        response = http.request('PUT', responseUrl, headers=headers, body=body)
         print("Status code:", response.status)
 
 
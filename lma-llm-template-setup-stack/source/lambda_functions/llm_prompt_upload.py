@@ -2,6 +2,7 @@ import boto3
 import cfnresponse
 import json
 import os
+from functools import lru_cache
 
 DEFAULT_PROMPT_TEMPLATES_PK = "DefaultSummaryPromptTemplates"
 CUSTOM_PROMPT_TEMPLATES_PK = "CustomSummaryPromptTemplates"
@@ -12,17 +13,25 @@ CUSTOM_PROMPT_TEMPLATES_INFO = f"""LMA custom summary prompt templates. Any key
 To disable a default value, override it here with the same key, and value either emplty or 'NONE'. Prompt keys must be in the form 'N#Title' where N is a sequence number.
 """
 
+dynamodb = boto3.resource('dynamodb')
+
+@lru_cache(maxsize=8)
+def get_table(table_name):
+    return dynamodb.Table(table_name)
+
+@lru_cache(maxsize=1)
+def get_prompt_templates():
+    llm_prompt_summary_template_file = os.environ['LAMBDA_TASK_ROOT'] + "/LLMPromptSummaryTemplate.json"
+    with open(llm_prompt_summary_template_file) as f:
+        return json.load(f)
+
 def get_new_item(pk, info, prompt_templates):
     item = {
         'LLMPromptTemplateId': pk,
         '*Information*': info
     }
-    i = 1
-    for key, value in prompt_templates.items():
-        # prepend sequence number to allow control of sort order later
-        attr_name = f"{i}#{key}"
-        item[attr_name] = value
-        i += 1
+    # prepend sequence number to allow control of sort order later
+    item.update({f"{i}#{key}": value for i, (key, value) in enumerate(prompt_templates.items(), 1)})
     return item
 
 def lambda_handler(event, context):
@@ -34,25 +43,23 @@ def lambda_handler(event, context):
     try:
         if the_event in ('Create', 'Update'):
             promptTemplateTableName = event['ResourceProperties']['LLMPromptTemplateTableName']
-
-            llm_prompt_summary_template_file = os.environ['LAMBDA_TASK_ROOT'] + "/LLMPromptSummaryTemplate.json"
-            llm_prompt_summary_template = open(llm_prompt_summary_template_file).read()
-            dynamodb = boto3.resource('dynamodb')
-            promptTable = dynamodb.Table(promptTemplateTableName)
+            promptTable = get_table(promptTemplateTableName)
            
             print("Populating / updating default prompt item (for Create or Update event):", promptTemplateTableName)
-            prompt_templates_str = llm_prompt_summary_template
-            prompt_templates = json.loads(prompt_templates_str)
+            prompt_templates = get_prompt_templates()
             item = get_new_item(DEFAULT_PROMPT_TEMPLATES_PK, DEFAULT_PROMPT_TEMPLATES_INFO, prompt_templates)
-            print("Writing default item to DDB:", json.dumps(item))
+            # serialize for logging before the write, boto3 converts the item in place
+            item_json = json.dumps(item, separators=(',', ':'))
             response = promptTable.put_item(Item=item)
+            print("Wrote default item to DDB:", item_json)
             print("DDB response", response)
 
             if the_event in ('Create'):
                 print("Populating Custom Prompt table with default prompts (for Create event):", promptTemplateTableName)
                 item = get_new_item(CUSTOM_PROMPT_TEMPLATES_PK, CUSTOM_PROMPT_TEMPLATES_INFO, {})
-                print("Writing initial custom item to DDB:", json.dumps(item))
+                item_json = json.dumps(item, separators=(',', ':'))
                 response = promptTable.put_item(Item=item)
+                print("Wrote initial custom item to DDB:", item_json)
                 print("DDB response", response)
 
     except Exception as e: